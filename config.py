@@ -14,7 +14,15 @@ class Config:
     MAX_CONTENT_LENGTH = 50 * 1024 * 1024  # 50MB max file size
     
     # Conversion settings
-    CONVERTER_SCRIPT = 'convert-to-md.py'
+    CONVERTER_SCRIPT = 'convert_to_md.py'
+    # Server processes gunicorn starts (see gunicorn.conf.py), each with its own conversion pool
+    SERVER_WORKERS = int(os.environ.get('WEB_CONCURRENCY') or os.cpu_count() or 1)
+    # Concurrent conversions per server process; pending ones wait in the pool's queue.
+    # The default shares the CPUs out between the server processes, so the host runs
+    # about one pandoc process per CPU
+    MAX_CONVERSION_WORKERS = int(os.environ.get('MAX_CONVERSION_WORKERS')
+                                 or max(1, (os.cpu_count() or 1) // SERVER_WORKERS))
+    CONVERSION_TIMEOUT = 300  # Seconds, matches the gunicorn worker timeout
     
     # Logging settings
     @staticmethod
@@ -54,6 +62,11 @@ class Config:
         config = {
             'SECRET_KEY': Config.SECRET_KEY,
             'MAX_CONTENT_LENGTH': Config.MAX_CONTENT_LENGTH,
+            # Converted Markdown and JATS XML compress well, so compress them along
+            # with the page itself
+            'COMPRESS_MIMETYPES': ['text/html', 'text/css', 'application/javascript',
+                                   'text/markdown', 'application/xml'],
+            'COMPRESS_LEVEL': 6,
         }
         
         if Config.is_production():
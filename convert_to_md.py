@@ -0,0 +1,1018 @@
+#!/usr/bin/env python3
+"""
+Simple DOCX/Markdown to Markdown/XML Converter
+
+This script automatically detects input format and converts accordingly:
+- DOCX → Markdown (with formatting fixes and table preservation)
+- Markdown → JATS XML (with figure parsing)
+- DOCX → JATS XML, when the output file has an .xml extension
+
+Usage:
+    python convert_to_md.py input.docx                    # DOCX → input.md
+    python convert_to_md.py input.md                      # Markdown → input.xml
+    python convert_to_md.py input.docx -o output.md       # DOCX → output.md
+    python convert_to_md.py input.md -o output.xml        # Markdown → output.xml
+    python convert_to_md.py input.docx -o output.xml      # DOCX → output.xml (JATS)
+"""
+
+import argparse
+import binascii
+import functools
+import io
+import logging
+import os
+import sys
+import subprocess
+import re
+import shutil
+import time
+from pathlib import Path
+from typing import BinaryIO, Iterator, Optional, Tuple
+
+# Progress and errors are logged rather than printed, so that the server (which
+# imports this module) decides where they go; main() prints them for the CLI
+logger = logging.getLogger(__name__)
+
+
+# Pre-compiled patterns used by the post-processing passes below. Compiling them
+# once at import time avoids the re module cache lookup on every call.
+
+# Markdown: single asterisk italics (*text*, but not **text** or ***text***), and
+# the same with any run of adjacent ones so they can be converted and merged at once
+_ASTERISK_ITALIC = re.compile(r'(?<!\*)\*([^*]+?)\*(?!\*)')
+_ASTERISK_ITALICS = re.compile(r'(?<!\*)\*[^*]+?\*(?!\*)(?:\s+(?<!\*)\*[^*]+?\*(?!\*))*')
+
+# Markdown: runs of adjacent bold / bold+italic segments (**text** or ***text***),
+# matched whole so a sentence pandoc split into any number of segments is merged
+# in one pass. A run that has a ***text*** segment may also end in a partial ***text*
+_BOLD_SEGMENT = r'(?:\*\*\*[^*]+?\*\*\*|\*\*[^*]+?\*\*)'
+_SPLIT_BOLD = re.compile(
+    rf'(?<!\*)(?=\*\*)(?:{_BOLD_SEGMENT}\s*)*'
+    rf'(?:\*\*\*[^*]+?\*\*\*\s*(?:{_BOLD_SEGMENT}\s*)*\*\*\*[^*]+?\*'
+    rf'|{_BOLD_SEGMENT}\s*{_BOLD_SEGMENT})(?!\*)'
+)
+# The segments of a matched run: (marker, text) for full ones, text for a partial
+_BOLD_PART = re.compile(r'(\*\*\*?)([^*]+?)\1|\*\*\*([^*]+?)\*')
+
+# Markdown: runs of two or more adjacent italic words, matched whole so a run
+# of any length is consolidated in one pass
+_UNDERSCORE_ITALIC = re.compile(r'_([^_]+)_')
+_UNDERSCORE_ITALIC_RUN = re.compile(r'_[^_]+_(?:\s+_[^_]+_)+')
+
+# Markdown: image dimension attributes and image links
+_IMAGE_DIMENSIONS = re.compile(r'\s*\{[^}]*(?:width|height)\s*=\s*"[^"]*"[^}]*\}\s*')
+_IMAGE_LINK = re.compile(r'!\[([^\]]*)\]\(([^)]+)\)')
+
+# JATS: figure blocks and the pieces extracted from them. The label, the
+# inline-graphic element and the caption are captured separately so the image
+# attributes are only ever read from the graphic itself. The lazy [^>]*? lets a
+# self-closing graphic end at its own '/>' rather than at a later </inline-graphic>.
+_INLINE_GRAPHIC = r'(?P<graphic><inline-graphic\b[^>]*?(?:/>|>.*?</inline-graphic>))'
+_FIGURE_SINGLE = re.compile(
+    r'<p[^>]*>\s*<bold[^>]*>(?P<label>Figure\s+\d+)</bold>\s*' + _INLINE_GRAPHIC + r'\s*(?P<caption>.*?)</p>',
+    re.MULTILINE | re.DOTALL
+)
+_FIGURE_MULTI = re.compile(
+    r'<p[^>]*>\s*<bold[^>]*>(?P<label>Figure\s+\d+)</bold>\s*</p>.*?<p[^>]*>\s*' + _INLINE_GRAPHIC + r'\s*(?P<caption>.*?)</p>',
+    re.MULTILINE | re.DOTALL
+)
+_XLINK_HREF = re.compile(r'xlink:href="([^"]+)"')
+_MIME_SUBTYPE = re.compile(r'mime-subtype="([^"]+)"')
+
+# JATS: table cells and their block-level contents
+_TABLE_CELL = re.compile(r'<td([^>]*)>(.*?)</td>', re.DOTALL)
+_WRAPPER_DISP_QUOTE = re.compile(r'<p\s+specific-use="wrapper"\s*>\s*<disp-quote>(.*?)</disp-quote>\s*</p>', re.DOTALL)
+_PARAGRAPH = re.compile(r'<p>(.*?)</p>', re.DOTALL)
+
+# JATS: document body and the section tags inside it
+_BODY = re.compile(r'(<body[^>]*>)(.*?)(</body>)', re.MULTILINE | re.DOTALL)
+_SEC_TAG = re.compile(r'<(/?)sec(?=[\s/>])[^>]*?(/?)>')
+_SEC_WITHOUT_ID = re.compile(r'<sec(?=[\s/>])(?![^>]*\bid=)')
+
+# Chunk size for piping uploaded documents into pandoc's stdin
+_STDIN_COPY_BUFSIZE = 1024 * 1024
+
+
+def _time_left(deadline: Optional[float]) -> Optional[float]:
+    """Seconds left until a time.monotonic() deadline, or None when there is no deadline."""
+    if deadline is None:
+        return None
+    return max(deadline - time.monotonic(), 0)
+
+
+@functools.lru_cache(maxsize=1)
+def _pandoc_info() -> Tuple[bool, str]:
+    """Run `pandoc --version` once and return (installed, version line)."""
+    try:
+        result = subprocess.run(['pandoc', '--version'], 
+                              capture_output=True, text=True, check=True)
+        return True, result.stdout.split('\n')[0]
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False, "Unknown"
+
+
+def check_pandoc_installed() -> bool:
+    """Check if pandoc is installed and available."""
+    return _pandoc_info()[0]
+
+
+def get_pandoc_version() -> str:
+    """Get pandoc version string."""
+    return _pandoc_info()[1]
+
+
+def fix_split_bold_formatting(content: str) -> str:
+    """
+    Fix split bold formatting by merging adjacent bold segments that should be one sentence.
+    
+    This addresses the issue where pandoc splits a bold sentence into multiple bold segments
+    due to mixed formatting (bold + italics + quotes). A whole run of adjacent segments
+    is merged into one; it stays plain bold only if every segment was plain bold.
+    
+    Args:
+        content: The markdown content to process
+        
+    Returns:
+        The content with fixed bold formatting
+    
+    Examples:
+        >>> fix_split_bold_formatting('**The quick** ***brown*** **fox**')
+        '***The quick brown fox***'
+        >>> fix_split_bold_formatting('**Bold** **bold** ***x***')
+        '***Bold bold x***'
+        >>> fix_split_bold_formatting('***a*** ***b*** ***c***')
+        '***a b c***'
+        >>> fix_split_bold_formatting('**a** **b** and ***c*** ***d* e')
+        '**a b** and ***c d*** e'
+    """
+    def merge_split_bold(match):
+        parts = _BOLD_PART.findall(match.group(0))
+        text = ' '.join((part[1] or part[2]).strip() for part in parts)
+        # Stay plain bold only if every segment was; any bold+italic makes it ***
+        marker = '**' if all(part[0] == '**' for part in parts) else '***'
+        return f'{marker}{text}{marker}'
+    
+    content = _SPLIT_BOLD.sub(merge_split_bold, content)
+    
+    return content
+
+
+def _merge_asterisk_italics(match, marker='*'):
+    """Merge a run of adjacent asterisk italics (*word* *word*) into one, delimited by `marker`."""
+    words = _ASTERISK_ITALIC.findall(match.group(0))
+    if len(words) == 1:
+        return f'{marker}{words[0]}{marker}'
+    return f'{marker}{" ".join(word.strip() for word in words)}{marker}'
+
+
+def _asterisk_italics_to_underscore(match):
+    """Convert *word* (or a run *word* *word*) to _word_ (or _word word_)."""
+    return _merge_asterisk_italics(match, '_')
+
+
+def _merge_underscore_italics(match):
+    """Merge a run of adjacent underscore italics into one."""
+    words = [text.strip() for text in _UNDERSCORE_ITALIC.findall(match.group(0))]
+    return f'_{" ".join(words)}_'
+
+
+def _consolidate_underscore_italics(content: str) -> str:
+    """Merge runs of adjacent underscore italics (_word_ _word_) into one italic block."""
+    if '_' in content:
+        content = _UNDERSCORE_ITALIC_RUN.sub(_merge_underscore_italics, content)
+    return content
+
+
+def consolidate_adjacent_italics(content: str) -> str:
+    """
+    Consolidate adjacent italicized words into single italic blocks.
+    
+    This addresses the issue where pandoc creates separate italic blocks for each word
+    in a phrase that should be italicized as a whole.
+    
+    Args:
+        content: The markdown content to process
+        
+    Returns:
+        The content with consolidated italics
+    """
+    # Handle both underscore and asterisk italics
+    # Pattern to match adjacent italicized words: _word_ _word_ _word_ or *word* *word* *word*
+    
+    # First, handle underscore italics: _word_ _word_ _word_
+    content = _consolidate_underscore_italics(content)
+    
+    # Then, handle asterisk italics: *word* *word* *word*
+    # But only if they're not part of bold formatting (**text** or ***text***)
+    if '*' in content:
+        content = _ASTERISK_ITALICS.sub(_merge_asterisk_italics, content)
+    
+    return content
+
+
+def remove_image_dimensions(content: str) -> str:
+    """
+    Remove image dimensions from markdown content.
+    
+    This removes pandoc-generated dimension attributes like {width="6.268055555555556in" height="4.076388888888889in"}
+    from image references in markdown.
+    
+    Args:
+        content: The markdown content to process
+        
+    Returns:
+        The content with image dimensions removed
+    """
+    # Pattern to match image dimensions: {width="..." height="..."} or {width="..."} or {height="..."}
+    # This handles various combinations of width and height attributes in a single pass
+    content = _IMAGE_DIMENSIONS.sub('', content)
+    
+    return content
+
+
+def standardize_image_filename(filename: str) -> str:
+    """
+    Standardize image filenames by:
+    1. Converting extensions to lowercase
+    2. Standardizing jpeg to jpg
+    
+    Args:
+        filename: The original filename to standardize
+        
+    Returns:
+        The standardized filename
+    """
+    # Split filename and extension
+    name, ext = os.path.splitext(filename)
+    
+    # Convert extension to lowercase
+    ext = ext.lower()
+    
+    # Standardize jpeg to jpg
+    if ext == '.jpeg':
+        ext = '.jpg'
+    
+    # Handle DOCX image naming pattern (image1, image2, etc.)
+    # Match patterns like: image1, image2, image10, etc.
+    # image_pattern = r'^image(\d+)$'
+    # match = re.match(image_pattern, name, re.IGNORECASE)
+    
+    # if match:
+        # Convert image1 -> figure-1, image2 -> figure-2, etc.
+        # number = match.group(1)
+        # name = f'figure-{number}'
+    
+    return f'{name}{ext}'
+
+
+def process_image_links_to_basename(content: str) -> str:
+    """
+    Process image links in markdown to use only the basename (filename without path)
+    and standardize the filenames.
+    
+    This converts image references like ![alt](media/image1.png) to ![alt](figure-1.png)
+    for OJS compatibility where file paths are handled directly and filenames are standardized.
+    
+    Args:
+        content: The markdown content to process
+        
+    Returns:
+        The content with image links converted to basename only and standardized
+    """
+    # Pattern to match markdown image links: ![alt text](path/to/image.ext)
+    # This captures the alt text and the full path, then extracts just the basename
+    content = _IMAGE_LINK.sub(_replace_image_link, content)
+    
+    return content
+
+
+def _replace_image_link(match):
+    """Rewrite an image link to point at the standardized basename of its path."""
+    alt_text = match.group(1)
+    image_path = match.group(2)
+    
+    # Extract just the basename (filename with extension)
+    basename = os.path.basename(image_path)
+    
+    # Standardize the filename
+    standardized_basename = standardize_image_filename(basename)
+    
+    return f'![{alt_text}]({standardized_basename})'
+
+
+def _random_hex_ids(count: int, num_bytes: int) -> Iterator[str]:
+    """
+    Yield random hex IDs, drawing the randomness for the first `count` of them
+    from a single os.urandom() call and hex-encoding it with one hexlify() call,
+    instead of one call of each per ID.
+    
+    Args:
+        count: The number of IDs expected to be needed
+        num_bytes: The number of random bytes per ID (the ID has twice as many hex digits)
+        
+    Yields:
+        Random hex strings; IDs beyond `count` fall back to one os.urandom() call each
+    """
+    pool = binascii.hexlify(os.urandom(count * num_bytes)).decode('ascii')
+    width = 2 * num_bytes
+    for offset in range(0, len(pool), width):
+        yield pool[offset:offset + width]
+    while True:
+        yield os.urandom(num_bytes).hex()
+
+
+def parse_figures_for_jats(content: str) -> str:
+    """
+    Parse figure patterns from JATS XML content and convert them to proper JATS XML figure elements.
+    
+    This function looks for patterns in the JATS XML where pandoc has converted:
+    - Figure labels as bold text
+    - Images as inline-graphic elements
+    - Captions as text following the image
+    
+    And converts them to proper JATS XML figure elements.
+    
+    Args:
+        content: The JATS XML content to process
+        
+    Returns:
+        The content with figures converted to proper JATS XML format
+    
+    Examples:
+        A self-closing graphic ends its own figure instead of running on to the
+        next figure's </inline-graphic>:
+        
+        >>> xml = ('<p><bold>Figure 1</bold> <inline-graphic mime-subtype="png" xlink:href="media/image1.png" />'
+        ...        'First caption</p>'
+        ...        '<p><bold>Figure 2</bold> <inline-graphic mime-subtype="jpeg" xlink:href="media/image2.jpeg">'
+        ...        '</inline-graphic>Second caption</p>')
+        >>> figures = parse_figures_for_jats(xml)
+        >>> figures.count('<fig ')
+        2
+        >>> re.findall(r'<label>(.*?)</label>.*?<p id="[^"]*">(.*?)</p>.*?xlink:href="([^"]*)"', figures, re.DOTALL)
+        [('Figure 1', 'First caption', 'media/image1.png'), ('Figure 2', 'Second caption', 'media/image2.jpg')]
+    """
+    # Figure blocks in JATS XML come in two shapes:
+    # _FIGURE_SINGLE: <p><bold>Figure X</bold> <inline-graphic ... />caption</p>
+    # _FIGURE_MULTI: <p><bold>Figure X</bold></p>...<p><inline-graphic ... />caption</p>
+    # Both handle self-closing and paired inline-graphic elements
+    
+    # Nothing to do unless the document has both a figure label and an image
+    if '<inline-graphic' not in content or 'Figure' not in content:
+        return content
+    
+    # Six IDs per figure; every figure contains an inline-graphic
+    ids = _random_hex_ids(6 * content.count('<inline-graphic'), 12)
+    
+    def replace_figure(match):
+        label = match.group('label')
+        graphic = match.group('graphic')
+        caption_text = match.group('caption').strip()
+        
+        # Extract image information from inline-graphic element
+        href_match = _XLINK_HREF.search(graphic)
+        mime_subtype_match = _MIME_SUBTYPE.search(graphic)
+        
+        image_filename = href_match.group(1) if href_match else "image.png"
+        # Standardize the filename
+        image_filename = standardize_image_filename(image_filename)
+        mime_subtype = mime_subtype_match.group(1) if mime_subtype_match else "png"
+        
+        # Generate unique IDs
+        fig_id = f"fig-{next(ids)}"
+        object_id = f"object-id-{next(ids)}"
+        caption_id = f"caption-{next(ids)}"
+        title_id = f"title-{next(ids)}"
+        p_id = f"p-{next(ids)}"
+        graphic_id = f"graphic-{next(ids)}"
+        
+        # Build JATS XML figure element
+        jats_figure = f'''<fig id="{fig_id}">
+        <object-id id="{object_id}">{fig_id}</object-id>
+        <label>{label}</label>
+        <caption id="{caption_id}">
+          <title id="{title_id}" />
+          <p id="{p_id}">{caption_text}</p>
+        </caption>
+        <graphic id="{graphic_id}" mime-subtype="{mime_subtype}" mimetype="image" xlink:href="{image_filename}" />
+      </fig>'''
+        
+        return jats_figure
+    
+    # Apply the figure conversion - try multi-paragraph pattern first, then single paragraph
+    content = _FIGURE_MULTI.sub(replace_figure, content)
+    content = _FIGURE_SINGLE.sub(replace_figure, content)
+    
+    return content
+
+
+def flatten_table_blockquotes(content: str) -> str:
+    """
+    Flatten complex table cell structures to simple, OJS-compatible format.
+
+    This addresses issues where Pandoc converts blockquotes (>) within markdown table
+    cells to <disp-quote> elements or creates multiple <p> elements, which don't render
+    properly in OJS. We simplify to a single paragraph with line breaks.
+
+    Args:
+        content: The JATS XML content to process
+
+    Returns:
+        The content with table cells simplified for OJS compatibility
+    """
+    # Nothing to do for documents without tables
+    if '<td' not in content:
+        return content
+
+    def process_table_cell(match):
+        td_attrs = match.group(1)
+        td_content = match.group(2).strip()
+
+        # If cell is empty or has no paragraph tags, return as-is
+        if not td_content or '<p>' not in td_content:
+            return match.group(0)
+
+        # Step 1: Remove disp-quote and wrapper paragraphs
+        # Pattern: <p specific-use="wrapper"><disp-quote>...</disp-quote></p>
+        td_content = _WRAPPER_DISP_QUOTE.sub(r'\1', td_content)
+
+        # Step 2: Extract all paragraph contents
+        paragraphs = _PARAGRAPH.findall(td_content)
+
+        if not paragraphs:
+            return match.group(0)
+
+        # Step 3: Join paragraphs with semicolon separators
+        # OJS sanitizes out all break elements (<p>, <break/>, <br/>) and line break characters
+        # from table cells. Use semicolons to separate citations for readability.
+        combined_content = paragraphs[0].strip()
+        for para in paragraphs[1:]:
+            para_stripped = para.strip()
+            if para_stripped:
+                # Add semicolon separator for readability
+                combined_content += f'; {para_stripped}'
+
+        # Don't wrap in <p> - OJS needs direct content in table cells
+        processed_td_content = combined_content
+
+        return f'<td{td_attrs}>{processed_td_content}</td>'
+
+    # Apply the table cell processing to all table cells
+    content = _TABLE_CELL.sub(process_table_cell, content)
+
+    return content
+
+
+def wrap_body_content_in_sections(content: str) -> str:
+    r"""
+    Ensure all content within the <body> tag is wrapped in <sec> tags.
+
+    This function looks for content directly inside the <body> tag that is not already
+    wrapped in <sec> tags and wraps it appropriately. Each section gets a unique ID.
+    Existing top-level sections, including any nested ones, are kept as they are apart
+    from adding missing IDs.
+
+    Args:
+        content: The JATS XML content to process
+
+    Returns:
+        The content with body content properly wrapped in sec tags with unique IDs
+
+    Examples:
+        >>> xml = ('<body>\n<p>Intro</p>\n<sec>\n  <title>A</title>\n  <sec id="s2">\n'
+        ...        '    <p>Inner</p>\n\n  </sec>\n  <p>Tail</p>\n</sec>\n<p>After</p>\n\n</body>')
+        >>> print(re.sub(r'heading-[0-9a-f]+', 'heading-ID', wrap_body_content_in_sections(xml)))
+        <body>
+          <sec id="heading-ID">
+        <p>Intro</p>
+          </sec>
+        <sec id="heading-ID">
+          <title>A</title>
+          <sec id="s2">
+            <p>Inner</p>
+        <BLANKLINE>
+          </sec>
+          <p>Tail</p>
+        </sec>
+          <sec id="heading-ID">
+        <p>After</p>
+          </sec>
+        </body>
+    """
+    # Nothing to do for documents without a body
+    if '<body' not in content:
+        return content
+    
+    def wrap_body_content(match):
+        body_open = match.group(1)
+        body_content = match.group(2)
+        body_close = match.group(3)
+        
+        # If body is empty or only contains whitespace, return as is
+        if not body_content.strip():
+            return f"{body_open}{body_content}{body_close}"
+        
+        # Locate the top-level <sec>...</sec> spans, tracking depth so nested
+        # sections stay inside their parent
+        sections = []
+        depth = 0
+        section_start = 0
+        for tag in _SEC_TAG.finditer(body_content):
+            if tag.group(2):
+                # Self-closing <sec />, nothing to balance
+                continue
+            if not tag.group(1):
+                if depth == 0:
+                    # Start the span at the beginning of the line to keep its indentation
+                    line_start = body_content.rfind('\n', 0, tag.start()) + 1
+                    if body_content[line_start:tag.start()].strip():
+                        line_start = tag.start()
+                    section_start = max(line_start, sections[-1][1] if sections else 0)
+                depth += 1
+            elif depth:
+                depth -= 1
+                if depth == 0:
+                    sections.append((section_start, tag.end()))
+        if depth:
+            # Unbalanced section tags, keep the rest of the body as it is
+            sections.append((section_start, len(body_content)))
+        
+        # At most one ID per existing section plus one per wrapped gap between them
+        ids = _random_hex_ids(body_content.count('<sec') + len(sections) + 1, 16)
+        
+        def add_section_id(sec_match):
+            return f'<sec id="heading-{next(ids)}"'
+        
+        # Emit the processed lines straight into one buffer, each followed by a newline
+        buf = io.StringIO()
+        
+        def wrap_loose_content(text):
+            # Wrap any non-blank lines, dropping the blank lines around them
+            lines = text.split('\n')
+            while lines and not lines[-1].strip():
+                lines.pop()
+            while lines and not lines[0].strip():
+                lines.pop(0)
+            if lines:
+                section_id = f"heading-{next(ids)}"
+                buf.write(f'  <sec id="{section_id}">\n')
+                for line in lines:
+                    buf.write(line)
+                    buf.write('\n')
+                buf.write('  </sec>\n')
+        
+        # Wrap the content between top-level sections, and give existing
+        # sections an ID where they lack one
+        position = 0
+        for start, end in sections:
+            wrap_loose_content(body_content[position:start])
+            buf.write(_SEC_WITHOUT_ID.sub(add_section_id, body_content[start:end]))
+            buf.write('\n')
+            position = end
+        wrap_loose_content(body_content[position:])
+        
+        # Drop the newline after the last line
+        processed_content = buf.getvalue()[:-1]
+        
+        return f"{body_open}\n{processed_content}\n{body_close}"
+    
+    # Apply the section wrapping
+    content = _BODY.sub(wrap_body_content, content)
+    
+    return content
+
+
+
+
+
+def _docx_to_markdown(input_file: str, output_file: str, timeout: Optional[float] = None) -> str:
+    """
+    Convert a DOCX file to post-processed Markdown text using pandoc.
+    
+    Media embedded in the document is extracted to a media/ directory next to
+    the output file.
+    
+    Args:
+        input_file: Path to input DOCX file
+        output_file: Path the Markdown (or anything derived from it) will be written to
+        timeout: Seconds to let pandoc run before it is killed, or None to wait for it
+    
+    Returns:
+        The post-processed Markdown content
+    
+    Raises:
+        subprocess.CalledProcessError: If pandoc fails
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    # Get the output directory for media extraction
+    output_dir = os.path.dirname(output_file) or '.'
+    media_dir = os.path.join(output_dir, 'media')
+    
+    # Create a temporary directory for extraction to avoid nested media/media structure
+    temp_extract_dir = os.path.join(output_dir, 'temp_extract')
+    
+    # Build pandoc command, writing to stdout so the output is post-processed in memory
+    cmd = ['pandoc', input_file, '-o', '-']
+    
+    # Set output format to markdown with multiline tables (automatic table preservation)
+    cmd.extend(['--to', 'markdown+multiline_tables'])
+    
+    # Add options for better academic document handling
+    cmd.extend([
+        '--wrap=none',  # Don't wrap lines
+        '--markdown-headings=atx',  # Use # style headings
+        '--reference-location=document',  # Put references at end
+        '--extract-media=' + temp_extract_dir,  # Extract media to temporary directory
+    ])
+    
+    result = subprocess.run(cmd, capture_output=True, text=True, encoding='utf-8', check=True, timeout=timeout)
+    
+    # Move extracted media files from temp directory to final media directory.
+    # pandoc only creates temp_extract_dir/media/ when the document has media, so
+    # list it directly instead of checking for it first
+    temp_media_dir = os.path.join(temp_extract_dir, 'media')
+    try:
+        media_files = os.listdir(temp_media_dir)
+    except FileNotFoundError:
+        media_files = None
+    
+    if media_files is not None:
+        # Create the final media directory if it doesn't exist
+        os.makedirs(media_dir, exist_ok=True)
+        
+        # Move files from temp_extract_dir/media/ to media_dir/
+        for file in media_files:
+            src = os.path.join(temp_media_dir, file)
+            # Standardize the filename
+            standardized_filename = standardize_image_filename(file)
+            dst = os.path.join(media_dir, standardized_filename)
+            shutil.move(src, dst)
+        
+        # Remove the temporary extraction directory
+        shutil.rmtree(temp_extract_dir)
+        logger.info("✓ Extracted media files to '%s'", media_dir)
+    
+    return _postprocess_markdown(result.stdout)
+
+
+def _postprocess_markdown(content: str) -> str:
+    """
+    Apply the Markdown fixes to pandoc's DOCX → Markdown output.
+    
+    Args:
+        content: The markdown content produced by pandoc
+        
+    Returns:
+        The post-processed Markdown content
+    """
+    # pandoc's markdown writer has no option to emit underscore emphasis, so the
+    # asterisk rewrites stay, but each pass is skipped when the text it looks for
+    # is absent
+    if '*' in content:
+        # Convert single asterisk italics to underscore italics, merging runs of adjacent
+        # ones in the same pass
+        # This regex matches *text* but not **text** (bold) or ***text*** (bold italic)
+        content = _ASTERISK_ITALICS.sub(_asterisk_italics_to_underscore, content)
+        
+        # Fix split bold formatting - merge adjacent bold segments that should be one sentence
+        content = fix_split_bold_formatting(content)
+    
+    # Consolidate adjacent italic words into single italic blocks. Only underscore
+    # italics are left by now, so consolidate_adjacent_italics' asterisk pass is skipped
+    content = _consolidate_underscore_italics(content)
+
+    if '{' in content:
+        # Remove image dimensions
+        content = remove_image_dimensions(content)
+
+    if '![' in content:
+        # Process image links to use basename only (for OJS compatibility)
+        content = process_image_links_to_basename(content)
+    
+    return content
+
+
+def convert_docx_stream_to_markdown(stream: BinaryIO, timeout: Optional[float] = None) -> str:
+    """
+    Convert an open DOCX file object to Markdown by piping it through pandoc's stdin.
+    
+    Nothing is written to disk: the document is streamed to pandoc and the result is
+    returned as a string. Media is not extracted; image links still point at the
+    standardized image basenames.
+    
+    Args:
+        stream: Binary file object positioned at the start of the DOCX data
+        timeout: Seconds to let pandoc run, including feeding it the upload, before
+            it is killed, or None to wait for it
+    
+    Returns:
+        The post-processed Markdown content
+    
+    Raises:
+        subprocess.CalledProcessError: If pandoc fails
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    cmd = ['pandoc', '-', '--from', 'docx', '-o', '-']
+    cmd.extend(['--to', 'markdown+multiline_tables'])
+    cmd.extend([
+        '--wrap=none',  # Don't wrap lines
+        '--markdown-headings=atx',  # Use # style headings
+        '--reference-location=document',  # Put references at end
+    ])
+    
+    deadline = None if timeout is None else time.monotonic() + timeout
+    proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        try:
+            # Copy the upload in 1 MB chunks, giving up once the deadline has passed
+            for chunk in iter(functools.partial(stream.read, _STDIN_COPY_BUFSIZE), b''):
+                proc.stdin.write(chunk)
+                if _time_left(deadline) == 0:
+                    raise subprocess.TimeoutExpired(cmd, timeout)
+        except BrokenPipeError:
+            # pandoc exited early; its return code and stderr say why
+            pass
+        stdout, stderr = proc.communicate(timeout=_time_left(deadline))
+    except BaseException:
+        # Reading the upload failed (e.g. the client disconnected) or pandoc ran out
+        # of time; don't leave pandoc running
+        proc.kill()
+        proc.wait()
+        raise
+    if proc.returncode != 0:
+        raise subprocess.CalledProcessError(proc.returncode, cmd, stdout, stderr.decode('utf-8', 'replace'))
+    
+    return _postprocess_markdown(stdout.decode('utf-8'))
+
+
+def _markdown_to_jats(input_file: str, markdown: Optional[str] = None,
+                      timeout: Optional[float] = None) -> str:
+    """
+    Convert Markdown to post-processed JATS XML text using pandoc.
+    
+    Args:
+        input_file: Path to input Markdown file, or '-' to read `markdown` from stdin
+        markdown: The Markdown content to convert when input_file is '-'
+        timeout: Seconds to let pandoc run before it is killed, or None to wait for it
+    
+    Returns:
+        The post-processed JATS XML content
+    
+    Raises:
+        subprocess.CalledProcessError: If pandoc fails
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    # Build pandoc command, writing to stdout so the output is post-processed in memory
+    cmd = ['pandoc', input_file, '--from', 'markdown', '-o', '-']
+    
+    # Set output format to JATS archiving
+    cmd.extend(['--to', 'jats_archiving'])
+    
+    # Add standalone option
+    cmd.append('--standalone')
+    
+    # Add options for better academic document handling
+    cmd.extend([
+        '--wrap=none',  # Don't wrap lines
+        '--reference-location=document',  # Put references at end
+    ])
+    
+    result = subprocess.run(cmd, input=markdown, capture_output=True, text=True, encoding='utf-8', check=True,
+                            timeout=timeout)
+    
+    # Post-process the JATS XML to handle figure parsing
+    content = result.stdout
+
+    # Parse and convert figure patterns to proper JATS XML
+    content = parse_figures_for_jats(content)
+
+    # Flatten blockquotes in table cells to styled-content elements
+    content = flatten_table_blockquotes(content)
+
+    # Wrap body content in sections
+    content = wrap_body_content_in_sections(content)
+    
+    return content
+
+
+def convert_markdown_stream_to_xml(stream: BinaryIO, timeout: Optional[float] = None) -> str:
+    """
+    Convert an open Markdown file object to JATS XML by piping it through pandoc's stdin.
+    
+    Args:
+        stream: Binary file object positioned at the start of the UTF-8 Markdown
+        timeout: Seconds to let pandoc run before it is killed, or None to wait for it
+    
+    Returns:
+        The post-processed JATS XML content
+    
+    Raises:
+        subprocess.CalledProcessError: If pandoc fails
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    return _markdown_to_jats('-', stream.read().decode('utf-8'), timeout=timeout)
+
+
+def convert_docx_stream_to_jats(stream: BinaryIO, timeout: Optional[float] = None) -> str:
+    """
+    Convert an open DOCX file object straight to JATS XML, piping it through pandoc twice.
+    
+    Like convert_docx_stream_to_markdown, nothing is written to disk and media is not
+    extracted; the intermediate Markdown stays in memory.
+    
+    Args:
+        stream: Binary file object positioned at the start of the DOCX data
+        timeout: Seconds to let the pandoc runs take in total before pandoc is
+            killed, or None to wait for them
+    
+    Returns:
+        The post-processed JATS XML content
+    
+    Raises:
+        subprocess.CalledProcessError: If pandoc fails
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    deadline = None if timeout is None else time.monotonic() + timeout
+    markdown = convert_docx_stream_to_markdown(stream, timeout=timeout)
+    return _markdown_to_jats('-', markdown, timeout=_time_left(deadline))
+
+
+def convert_docx_to_markdown(input_file: str, output_file: str, timeout: Optional[float] = None) -> bool:
+    """
+    Convert a DOCX file to Markdown using pandoc.
+    
+    Args:
+        input_file: Path to input DOCX file
+        output_file: Path to output Markdown file
+        timeout: Seconds to let pandoc run before it is killed, or None to wait for it
+    
+    Returns:
+        bool: True if conversion successful, False otherwise
+    
+    Raises:
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    if not os.path.exists(input_file):
+        logger.error("Error: Input file '%s' not found.", input_file)
+        return False
+    
+    try:
+        logger.info("Converting '%s' to '%s'...", input_file, output_file)
+        content = _docx_to_markdown(input_file, output_file, timeout=timeout)
+        
+        # Write the processed content once
+        Path(output_file).write_text(content, encoding='utf-8')
+        
+        logger.info("✓ Successfully converted '%s' to '%s'", input_file, output_file)
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.error("✗ Error converting '%s': %s", input_file, e)
+        if e.stderr:
+            logger.error("Pandoc error: %s", e.stderr)
+        return False
+
+
+def convert_markdown_to_xml(input_file: str, output_file: str, timeout: Optional[float] = None) -> bool:
+    """
+    Convert a Markdown file to JATS XML using pandoc.
+    
+    Args:
+        input_file: Path to input Markdown file
+        output_file: Path to output JATS XML file
+        timeout: Seconds to let pandoc run before it is killed, or None to wait for it
+    
+    Returns:
+        bool: True if conversion successful, False otherwise
+    
+    Raises:
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    if not os.path.exists(input_file):
+        logger.error("Error: Input file '%s' not found.", input_file)
+        return False
+    
+    try:
+        logger.info("Converting '%s' to '%s'...", input_file, output_file)
+        content = _markdown_to_jats(input_file, timeout=timeout)
+        
+        # Write the processed content once
+        Path(output_file).write_text(content, encoding='utf-8')
+        
+        logger.info("✓ Successfully converted '%s' to '%s'", input_file, output_file)
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.error("✗ Error converting '%s' to JATS XML: %s", input_file, e)
+        if e.stderr:
+            logger.error("Pandoc error: %s", e.stderr)
+        return False
+
+
+def convert_docx_to_jats(input_file: str, output_file: str, timeout: Optional[float] = None) -> bool:
+    """
+    Convert a DOCX file straight to JATS XML using pandoc.
+    
+    The intermediate Markdown still gets the same fixes as convert_docx_to_markdown,
+    but it stays in memory and is piped into the second pandoc run on stdin
+    instead of going through a temporary file.
+    
+    Args:
+        input_file: Path to input DOCX file
+        output_file: Path to output JATS XML file
+        timeout: Seconds to let the pandoc runs take in total before pandoc is
+            killed, or None to wait for them
+    
+    Returns:
+        bool: True if conversion successful, False otherwise
+    
+    Raises:
+        subprocess.TimeoutExpired: If pandoc ran longer than timeout
+    """
+    if not os.path.exists(input_file):
+        logger.error("Error: Input file '%s' not found.", input_file)
+        return False
+    
+    try:
+        logger.info("Converting '%s' to '%s'...", input_file, output_file)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        markdown = _docx_to_markdown(input_file, output_file, timeout=timeout)
+        content = _markdown_to_jats('-', markdown, timeout=_time_left(deadline))
+        
+        # Write the processed content once
+        Path(output_file).write_text(content, encoding='utf-8')
+        
+        logger.info("✓ Successfully converted '%s' to '%s'", input_file, output_file)
+        return True
+    except subprocess.CalledProcessError as e:
+        logger.error("✗ Error converting '%s' to JATS XML: %s", input_file, e)
+        if e.stderr:
+            logger.error("Pandoc error: %s", e.stderr)
+        return False
+
+
+def main():
+    """Main function to handle command line arguments and execute conversion."""
+    parser = argparse.ArgumentParser(
+        description="Convert DOCX to Markdown or Markdown to JATS XML",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Examples:
+  %(prog)s input.docx                    # DOCX → input.md
+  %(prog)s input.md                      # Markdown → input.xml
+  %(prog)s input.docx -o output.md       # DOCX → output.md
+  %(prog)s input.md -o output.xml        # Markdown → output.xml
+  %(prog)s input.docx -o output.xml      # DOCX → output.xml (JATS)
+        """
+    )
+    
+    parser.add_argument('input', help='Input file (DOCX or Markdown)')
+    parser.add_argument('-o', '--output', help='Output file (optional)')
+    
+    args = parser.parse_args()
+    
+    # Show the converters' progress and errors on stdout
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
+    
+    # Check if pandoc is installed
+    if not check_pandoc_installed():
+        print("Error: pandoc is not installed or not found in PATH.")
+        print("Please install pandoc from https://pandoc.org/installing.html")
+        sys.exit(1)
+    
+    print(f"Using {get_pandoc_version()}")
+    
+    # Determine input type and output file
+    input_path = Path(args.input)
+    input_ext = input_path.suffix.lower()
+    
+    if input_ext == '.docx' and args.output and Path(args.output).suffix.lower() == '.xml':
+        # DOCX → XML
+        success = convert_docx_to_jats(args.input, args.output)
+        
+    elif input_ext == '.docx':
+        # DOCX → Markdown
+        if args.output:
+            output_file = args.output
+        else:
+            output_file = input_path.with_suffix('.md')
+        
+        success = convert_docx_to_markdown(args.input, str(output_file))
+        
+    elif input_ext == '.md':
+        # Markdown → XML
+        if args.output:
+            output_file = args.output
+        else:
+            output_file = input_path.with_suffix('.xml')
+        
+        success = convert_markdown_to_xml(args.input, str(output_file))
+        
+    else:
+        print(f"Error: Unsupported input format '{input_ext}'. Supported formats: .docx, .md")
+        sys.exit(1)
+    
+    if not success:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
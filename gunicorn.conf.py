@@ -1,17 +1,39 @@
 # Gunicorn configuration for production deployment
 import multiprocessing
+import os
+import sys
 
 # Server socket
 bind = "127.0.0.1:5001"
 backlog = 2048
 
 # Worker processes
-workers = multiprocessing.cpu_count() * 2 + 1
-worker_class = "sync"
+# Each request spends most of its time waiting on a pandoc subprocess, so one
+# process per CPU with a few threads each keeps every core busy with pandoc runs.
+# WEB_CONCURRENCY overrides the count; config.py reads it too, to size each
+# process's conversion pool
+workers = int(os.environ.get('WEB_CONCURRENCY') or multiprocessing.cpu_count())
+worker_class = "gthread"
+threads = 4
 worker_connections = 1000
 timeout = 300  # 5 minutes for large file processing
 keepalive = 2
 
+# Import the app, and with it the converter module, once in the master process;
+# workers are forked with it already loaded instead of each importing it
+preload_app = True
+
+def pre_fork(server, worker):
+    """Write out the log records the preloaded app queued in the master, so workers don't inherit them."""
+    app_module = sys.modules.get('server')
+    if app_module is not None:
+        app_module.flush_log_queue()
+
+def post_fork(server, worker):
+    """Start the log listener thread in the worker; the master never runs one."""
+    from server import start_log_listener
+    start_log_listener()
+
 # Restart workers after this many requests, to help prevent memory leaks
 max_requests = 1000
 max_requests_jitter = 50
@@ -1,34 +1,44 @@
-import os
-import tempfile
+import atexit
+import functools
+import importlib.util
+import io
+import queue
+import re
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as ConversionTimeout
 import logging
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from flask import Flask, request, send_file, render_template
+from flask_compress import Compress
 from werkzeug.middleware.proxy_fix import ProxyFix
 from config import Config
 from version import get_version, get_version_display
 
+# Start of the first version entry in CHANGELOG.md
+_CHANGELOG_ENTRY_RE = re.compile(r'^## \[', re.MULTILINE)
+
+@functools.lru_cache(maxsize=1)
+def _read_changelog(changelog_path, mtime):
+    """Read the version entries of the changelog; cached until its mtime changes."""
+    content = changelog_path.read_text(encoding='utf-8')
+    # Extract just the version entries (skip the header and metadata), i.e. the
+    # content from the first version entry onwards
+    match = _CHANGELOG_ENTRY_RE.search(content)
+    return content[match.start():] if match else content
+
 def get_changelog_content():
     """Read and return the changelog content for display."""
     try:
         changelog_path = Path("CHANGELOG.md")
-        if changelog_path.exists():
-            content = changelog_path.read_text(encoding='utf-8')
-            # Extract just the version entries (skip the header and metadata)
-            lines = content.split('\n')
-            start_index = 0
-            for i, line in enumerate(lines):
-                if line.startswith('## ['):
-                    start_index = i
-                    break
-            
-            # Get content from first version entry onwards
-            changelog_content = '\n'.join(lines[start_index:])
-            return changelog_content
-        return "Changelog not available"
+        try:
+            mtime = changelog_path.stat().st_mtime
+        except FileNotFoundError:
+            return "Changelog not available"
+        return _read_changelog(changelog_path, mtime)
     except Exception as e:
-        logger.error(f"Error reading changelog: {str(e)}")
+        logger.error("Error reading changelog: %s", e)
         return "Error loading changelog"
 
 # Configure logging
@@ -46,14 +56,53 @@ file_handler.setFormatter(logging.Formatter(
     '%(asctime)s %(levelname)s: %(message)s [in %(pathname)s:%(lineno)d]'
 ))
 
-# Add the handlers to the logger
-logger.addHandler(file_handler)
+# Console output, formatted like the root handler set up by basicConfig
+console_handler = logging.StreamHandler()
+console_handler.setFormatter(logging.Formatter(logging.BASIC_FORMAT))
+
+# Add the handlers to the logger. Requests only put records on a queue; a
+# background listener thread does the console and file writes and rotation.
+# Records are not passed on to the root logger's (synchronous) handler as well
+queue_handler = QueueHandler(queue.Queue(-1))
+logger.addHandler(queue_handler)
+logger.propagate = False
+
+def start_log_listener():
+    """
+    Start the background thread that writes queued log records to the console and log file.
+
+    Under gunicorn this is called once in each worker by the post_fork hook (see
+    gunicorn.conf.py), so no thread is running when the master forks.
+    """
+    listener = QueueListener(queue_handler.queue, console_handler, file_handler, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return listener
+
+def flush_log_queue():
+    """Write out queued log records in the calling thread, for a process with no listener running."""
+    while True:
+        try:
+            record = queue_handler.queue.get_nowait()
+        except queue.Empty:
+            return
+        for handler in (console_handler, file_handler):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+# gunicorn has already been imported when it loads the app, and starts the
+# listener itself in each worker; otherwise (development server) start it here
+if 'gunicorn' not in sys.modules:
+    start_log_listener()
 
 app = Flask(__name__)
 
 # Apply configuration
 app.config.update(Config.get_app_config())
 
+# Compress responses, including the converted files
+Compress(app)
+
 # Configure for reverse proxy only in production
 if Config.is_production():
     app.wsgi_app = ProxyFix(
@@ -68,62 +117,64 @@ if Config.is_production():
 else:
     logger.info("🔧 Running in DEVELOPMENT mode")
 
-def _run_conversion(cmd):
-    """Helper function to run conversion commands with detailed logging."""
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True
-        )
-        logger.info(f"Command succeeded: {' '.join(cmd)}")
-        logger.debug(f"Command stdout: {result.stdout}")
-        if result.stderr:
-            logger.debug(f"Command stderr: {result.stderr}")
-        return True
-    except subprocess.CalledProcessError as e:
-        logger.error(f"Command failed: {' '.join(cmd)}")
-        logger.error(f"Return code: {e.returncode}")
-        logger.error(f"Error output: {e.stderr}")
-        logger.error(f"Command output: {e.stdout}")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error running command: {str(e)}")
-        return False
+def _load_converter():
+    """Import the converter script once at startup so requests call it in-process."""
+    script_path = Path(__file__).resolve().parent / Config.CONVERTER_SCRIPT
+    spec = importlib.util.spec_from_file_location('convert_to_md', script_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+convert_to_md = _load_converter()
+
+# The converter logs its progress and pandoc's errors; queue them the same way
+convert_to_md.logger.addHandler(queue_handler)
+convert_to_md.logger.propagate = False
+
+# Conversions run on a bounded thread pool so a burst of uploads cannot start an
+# unbounded number of pandoc processes at once
+_EXECUTOR = ThreadPoolExecutor(max_workers=Config.MAX_CONVERSION_WORKERS,
+                               thread_name_prefix='conversion')
 
 # Template configuration - now handled by Config class
 
+# Template values that stay the same for the life of the process
+_INDEX_CONTEXT = {
+    'form_action': Config.get_form_action(),
+    'app_version': get_version_display(),
+}
+
+def _render_index(**extra):
+    """Render the index page with the shared context plus any per-response values."""
+    return render_template('index.html', **_INDEX_CONTEXT,
+                           changelog_content=get_changelog_content(), **extra)
+
 @app.route('/')
 def index():
     """Handle requests to /docx-converter/"""
-    return render_template('index.html', 
-                         form_action=Config.get_form_action(),
-                         app_version=get_version_display(),
-                         changelog_content=get_changelog_content())
+    return _render_index()
 
 @app.route('/convert', methods=['POST'])
 def convert():
     """Handle document conversion."""
     try:
+        # Reject oversized uploads before the request body is parsed
+        if request.content_length and request.content_length > Config.MAX_CONTENT_LENGTH:
+            return _render_index(message=f"File too large. The maximum upload size is {Config.MAX_CONTENT_LENGTH // (1024 * 1024)} MB.", error=True)
+
         # Check if file was uploaded
         if 'document' not in request.files:
-            return render_template('index.html', 
-                                form_action=Config.get_form_action(),
-                                app_version=get_version_display(),
-                                changelog_content=get_changelog_content(),
-                                message="No file uploaded", error=True)
+            return _render_index(message="No file uploaded", error=True)
 
         file = request.files['document']
         if file.filename == '':
-            return render_template('index.html', 
-                                form_action=Config.get_form_action(),
-                                app_version=get_version_display(),
-                                changelog_content=get_changelog_content(),
-                                message="No file selected", error=True)
+            return _render_index(message="No file selected", error=True)
 
         # Determine conversion type based on file extension
+        # Parse the upload name once: the suffix picks the conversion and the stem
+        # names the download
         input_file = Path(file.filename)
+        stem = input_file.stem
         file_extension = input_file.suffix.lower()
 
         # Check if user wants JATS conversion (for DOCX files)
@@ -137,88 +188,50 @@ def convert():
         elif file_extension == '.md':
             format_type = 'jats'
         else:
-            return render_template('index.html', 
-                                form_action=Config.get_form_action(),
-                                app_version=get_version_display(),
-                                changelog_content=get_changelog_content(),
-                                message="Unsupported file type. Please upload a .docx or .md file.", error=True)
-
-        # Create temporary directory for processing
-        with tempfile.TemporaryDirectory() as temp_dir:
-            # Save uploaded file
-            input_path = os.path.join(temp_dir, file.filename)
-            file.save(input_path)
-
-            # Determine output filename and extension
-            if format_type == 'markdown':
-                output_filename = input_file.stem + '.md'
-                output_path = os.path.join(temp_dir, output_filename)
-                # Use convert-to-md.py for DOCX to Markdown
-                cmd = ['python', Config.CONVERTER_SCRIPT, input_path, '-o', output_path]
-                success = _run_conversion(cmd)
-
-            elif format_type == 'jats':
-                output_filename = input_file.stem + '.xml'
-                output_path = os.path.join(temp_dir, output_filename)
-                # Use convert-to-md.py for Markdown to JATS XML
-                cmd = ['python', Config.CONVERTER_SCRIPT, input_path, '-o', output_path]
-                success = _run_conversion(cmd)
-
-            elif format_type == 'docx-to-jats':
-                # Two-step conversion: DOCX → Markdown → JATS XML
-                output_filename = input_file.stem + '.xml'
-                output_path = os.path.join(temp_dir, output_filename)
-
-                # Step 1: Convert DOCX to Markdown
-                temp_md_path = os.path.join(temp_dir, input_file.stem + '_temp.md')
-                cmd1 = ['python', Config.CONVERTER_SCRIPT, input_path, '-o', temp_md_path]
-                success = _run_conversion(cmd1)
-
-                if success:
-                    # Step 2: Convert Markdown to JATS XML
-                    cmd2 = ['python', Config.CONVERTER_SCRIPT, temp_md_path, '-o', output_path]
-                    success = _run_conversion(cmd2)
-
-                    # Clean up temporary markdown file
-                    if os.path.exists(temp_md_path):
-                        os.remove(temp_md_path)
-            else:
-                return render_template('index.html', 
-                                    form_action=Config.get_form_action(),
-                                    app_version=get_version_display(),
-                                    changelog_content=get_changelog_content(),
-                                    message="Invalid format selected", error=True)
-
-            if not success:
-                return render_template('index.html', 
-                                    form_action=Config.get_form_action(),
-                                    app_version=get_version_display(),
-                                    changelog_content=get_changelog_content(),
-                                    message="Conversion failed", error=True)
-
-            # Check if output file exists
-            if not os.path.exists(output_path):
-                return render_template('index.html', 
-                                    form_action=Config.get_form_action(),
-                                    app_version=get_version_display(),
-                                    changelog_content=get_changelog_content(),
-                                    message="Output file not created", error=True)
-
-            # Return the converted file
-            return send_file(
-                output_path,
-                as_attachment=True,
-                download_name=output_filename,
-                mimetype='text/plain'
-            )
+            return _render_index(message="Unsupported file type. Please upload a .docx or .md file.", error=True)
+
+        # Stream the upload through pandoc (twice for DOCX to JATS XML, with the
+        # Markdown kept in memory); no temporary files
+        if format_type == 'markdown':
+            convert_stream = convert_to_md.convert_docx_stream_to_markdown
+            output_filename = stem + '.md'
+            mimetype = 'text/markdown'
+        elif format_type == 'docx-to-jats':
+            convert_stream = convert_to_md.convert_docx_stream_to_jats
+            output_filename = stem + '.xml'
+            mimetype = 'application/xml'
+        else:
+            convert_stream = convert_to_md.convert_markdown_stream_to_xml
+            output_filename = stem + '.xml'
+            mimetype = 'application/xml'
+        future = _EXECUTOR.submit(convert_stream, file.stream, timeout=Config.CONVERSION_TIMEOUT)
+        try:
+            content = future.result(timeout=Config.CONVERSION_TIMEOUT)
+        except subprocess.CalledProcessError as e:
+            logger.error("Conversion failed: %s", file.filename)
+            logger.error("Error output: %s", e.stderr)
+            return _render_index(message="Conversion failed", error=True)
+        except (ConversionTimeout, subprocess.TimeoutExpired):
+            # Drop the job if it is still queued, so nothing reads the upload once
+            # this response has gone; a running one is stopped by pandoc's timeout
+            future.cancel()
+            logger.error("Conversion timed out after %ss: %s", Config.CONVERSION_TIMEOUT, file.filename)
+            return _render_index(message="Conversion timed out", error=True)
+        logger.info("Conversion succeeded: %s -> %s", file.filename, output_filename)
+
+        return send_file(
+            io.BytesIO(content.encode('utf-8')),
+            as_attachment=True,
+            download_name=output_filename,
+            mimetype=mimetype
+        )
 
     except Exception as e:
-        return render_template('index.html', 
-                            form_action=Config.get_form_action(),
-                            static_url_prefix=Config.get_static_url_prefix(),
-                            app_version=get_version_display(),
-                            changelog_content=get_changelog_content(),
-                            message=f"Error: {str(e)}", error=True)
+        return _render_index(static_url_prefix=Config.get_static_url_prefix(), message=f"Error: {str(e)}", error=True)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=5001)
\ No newline at end of file
+    if Config.is_production():
+        # The development server handles requests one at a time; use gunicorn instead
+        logger.error("Refusing to start the development server in production, run: gunicorn -c gunicorn.conf.py server:app")
+    else:
+        app.run(debug=app.config['DEBUG'], host='0.0.0.0', port=5001, threaded=True)
\ No newline at end of file
@@ -5,6 +5,9 @@ Version information for the DOCX to JATS XML Converter application.
 __version__ = "1.2.0"
 __version_info__ = (1, 2, 0)
 
+# Formatted once at import; the version cannot change while the app is running
+VERSION_DISPLAY = f"v{__version__}"
+
 def get_version():
     """Return the current version string."""
     return __version__
@@ -15,4 +18,4 @@ def get_version_info():
 
 def get_version_display():
     """Return a formatted version string for display."""
-    return f"v{__version__}"
+    return VERSION_DISPLAY
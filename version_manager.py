@@ -10,6 +10,13 @@ import sys
 from datetime import datetime
 from pathlib import Path
 
+# Assignments in version.py rewritten by update_version()
+_VERSION_RE = re.compile(r'__version__ = "[^"]*"')
+_VERSION_INFO_RE = re.compile(r'__version_info__ = \([^)]*\)')
+
+# Start of the first version entry in CHANGELOG.md
+_CHANGELOG_ENTRY_RE = re.compile(r'^## \[', re.MULTILINE)
+
 def get_current_version():
     """Get the current version from version.py"""
     try:
@@ -30,19 +37,11 @@ def update_version(new_version):
     content = version_file.read_text()
     
     # Update version string
-    content = re.sub(
-        r'__version__ = "[^"]*"',
-        f'__version__ = "{new_version}"',
-        content
-    )
+    content = _VERSION_RE.sub(f'__version__ = "{new_version}"', content)
     
     # Update version info tuple
     major, minor, patch = new_version.split('.')
-    content = re.sub(
-        r'__version_info__ = \([^)]*\)',
-        f'__version_info__ = ({major}, {minor}, {patch})',
-        content
-    )
+    content = _VERSION_INFO_RE.sub(f'__version_info__ = ({major}, {minor}, {patch})', content)
     
     # Write updated content
     version_file.write_text(content)
@@ -80,18 +79,18 @@ def update_changelog(new_version, change_type="patch"):
 
 """
     
-    # Insert after the first line (after the title)
-    lines = content.split('\n')
-    insert_index = 1
-    for i, line in enumerate(lines):
-        if line.startswith('## ['):
-            insert_index = i
-            break
-    
-    lines.insert(insert_index, new_entry)
+    match = _CHANGELOG_ENTRY_RE.search(content)
+    if match:
+        # Insert before the first version entry
+        offset = match.start()
+        content = f"{content[:offset]}{new_entry}\n{content[offset:]}"
+    else:
+        # Insert after the first line (after the title)
+        title, sep, rest = content.partition('\n')
+        content = f"{title}\n{new_entry}{sep}{rest}"
     
     # Write updated content
-    changelog_file.write_text('\n'.join(lines))
+    changelog_file.write_text(content)
     print(f"Updated CHANGELOG.md with version {new_version}")
     return True
 